@@ -4,6 +4,8 @@ from flask import Flask, request, jsonify, Response, render_template
 import joblib
 import pandas as pd
 
+from model.explain import PipelineExplainer
+
 
 app = Flask(__name__)
 
@@ -30,6 +32,17 @@ def load_model():
     return _MODEL
 
 
+_EXPLAINER = None
+
+
+def get_explainer(model) -> PipelineExplainer:
+    """Build and cache the explainer for the currently loaded model."""
+    global _EXPLAINER
+    if _EXPLAINER is None or _EXPLAINER.pipeline is not model:
+        _EXPLAINER = PipelineExplainer(model)
+    return _EXPLAINER
+
+
 @app.route("/", methods=["GET"])
 def index() -> Response:
     """Serve the landing page for customer churn prediction."""
@@ -86,6 +99,60 @@ def predict():
 
     return jsonify(response), 200
 
+
+@app.route("/explain", methods=["POST"])
+def explain():
+    """Explain churn predictions with per-feature contributions.
+
+    Expected JSON body format:
+    {
+        "data": [
+            {"feature1": value, "feature2": value, ...}
+        ],
+        "top_k": 5  # optional, return only the k largest contributions per row
+    }
+    """
+    try:
+        model = load_model()
+    except FileNotFoundError as e:
+        return jsonify({"error": str(e)}), 500
+
+    payload = request.get_json(silent=True)
+    if not payload or "data" not in payload:
+        return jsonify({"error": "JSON body must contain 'data' key"}), 400
+
+    records = payload["data"]
+    if not isinstance(records, list) or len(records) == 0:
+        return jsonify({"error": "'data' must be a non-empty list of records"}), 400
+
+    top_k = payload.get("top_k")
+    if top_k is not None and (
+        isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1
+    ):
+        return jsonify({"error": "'top_k' must be a positive integer"}), 400
+
+    try:
+        df = pd.DataFrame(records)
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": f"Failed to construct DataFrame from input: {exc}"}), 400
+
+    try:
+        explainer = get_explainer(model)
+        # Transform once and share the matrix between contributions and probabilities
+        Xt = explainer.preprocessor.transform(df)
+        contributions = explainer.explain_transformed(Xt)
+        response = {
+            "units": explainer.units,
+            "base_value": explainer.base_value,
+            "contributions": explainer.top_k(contributions, top_k),
+            "churn_probability": explainer.classifier.predict_proba(Xt)[:, 1].tolist(),
+        }
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": f"Explanation failed: {exc}"}), 500
+
+    return jsonify(response), 200
+
+
 @app.route("/openapi.json", methods=["GET"])
 def openapi_spec() -> Response:
     """Minimal OpenAPI specification for this service."""
@@ -188,6 +255,64 @@ def openapi_spec() -> Response:
                     },
                 }
             },
+            "/explain": {
+                "post": {
+                    "summary": "Explain customer churn predictions",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "data": {
+                                            "type": "array",
+                                            "items": {"type": "object"},
+                                        },
+                                        "top_k": {"type": "integer", "minimum": 1},
+                                    },
+                                    "required": ["data"],
+                                },
+                            }
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Per-feature contributions for each record, largest magnitude first",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "units": {"type": "string"},
+                                            "base_value": {"type": "number", "format": "float"},
+                                            "contributions": {
+                                                "type": "array",
+                                                "items": {
+                                                    "type": "array",
+                                                    "items": {
+                                                        "type": "object",
+                                                        "properties": {
+                                                            "feature": {"type": "string"},
+                                                            "contribution": {"type": "number", "format": "float"},
+                                                        },
+                                                    },
+                                                },
+                                            },
+                                            "churn_probability": {
+                                                "type": "array",
+                                                "items": {"type": "number", "format": "float"},
+                                            },
+                                        },
+                                    }
+                                }
+                            },
+                        },
+                        "400": {"description": "Bad request"},
+                        "500": {"description": "Server error"},
+                    },
+                }
+            },
         },
     }
     return jsonify(spec)
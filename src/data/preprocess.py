@@ -1,32 +1,53 @@
+import argparse
 import os
+import sys
+
+import mlflow
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
-def get_root():
-    return os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
-def preprocess():
-    root = get_root()
-    raw_path = os.path.join(root, "data", "raw", "customer_churn.csv")
+from profiling import PROFILE_MODES, StageProfiler
 
-    df = pd.read_csv(raw_path)
+def get_root():
+    return os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 
+def clean(df):
+    """Apply the row-level cleaning shared by preprocessing and incremental updates."""
     if "customerID" in df.columns:
         df = df.drop(columns=["customerID"])
 
     if "TotalCharges" in df.columns:
         df["TotalCharges"] = pd.to_numeric(df["TotalCharges"], errors="coerce")
 
-    df = df.dropna()
-    df = df.drop_duplicates()
+    return df.dropna()
+
+def preprocess(profile=None):
+    root = get_root()
+    raw_path = os.path.join(root, "data", "raw", "customer_churn.csv")
+
+    profiler = StageProfiler("preprocess", profile=profile)
+
+    with profiler.stage("read_csv"):
+        df = pd.read_csv(raw_path)
+
+    with profiler.stage("clean"):
+        df = clean(df)
+
+    with profiler.stage("drop_duplicates"):
+        df = df.drop_duplicates()
 
     target_col = "Churn"
     if target_col not in df.columns:
         raise ValueError("Churn column 'Churn' not found in dataset")
 
-    train_df, test_df = train_test_split(
-        df, test_size=0.2, random_state=42, stratify=df[target_col]
-    )
+    with profiler.stage("split"):
+        train_df, test_df = train_test_split(
+            df, test_size=0.2, random_state=42, stratify=df[target_col]
+        )
 
     processed_dir = os.path.join(root, "data", "processed")
     os.makedirs(processed_dir, exist_ok=True)
@@ -34,10 +55,25 @@ def preprocess():
     train_path = os.path.join(processed_dir, "train.csv")
     test_path = os.path.join(processed_dir, "test.csv")
 
-    train_df.to_csv(train_path, index=False)
-    test_df.to_csv(test_path, index=False)
+    with profiler.stage("write_csv"):
+        train_df.to_csv(train_path, index=False)
+        test_df.to_csv(test_path, index=False)
 
-print("Preprocessing complete: train.csv and test.csv created")
+    mlflow.set_experiment("customer_churn_training")
+    with mlflow.start_run(run_name="preprocess"):
+        mlflow.log_param("profile", profile)
+        mlflow.log_metric("rows", len(df))
+        profiler.log_to_mlflow()
+        report_path = profiler.write_report()
+
+    print("Preprocessing complete: train.csv and test.csv created")
+    print(f"Preprocessing stage timings written to {report_path}")
 
 if __name__ == "__main__":
-    preprocess()
+    parser = argparse.ArgumentParser(description="Preprocess the raw churn dataset.")
+    parser.add_argument(
+        "--profile", choices=PROFILE_MODES, default=None,
+        help="Write a cProfile or sampling-profiler output for every stage.",
+    )
+    args = parser.parse_args()
+    preprocess(profile=args.profile)
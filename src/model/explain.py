@@ -0,0 +1,221 @@
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import OneHotEncoder
+
+
+def get_root():
+    return os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def _output_columns(preprocessor: ColumnTransformer):
+    """Map every transformed feature back to the input column it came from.
+
+    Returns the list of original column names and an integer array with, for
+    each output feature of the ColumnTransformer, the index of its source
+    column in that list.
+    """
+    columns = []
+    owners = np.empty(len(preprocessor.get_feature_names_out()), dtype=int)
+
+    for name, trans, cols in preprocessor.transformers_:
+        if trans == "drop":
+            continue
+        out = preprocessor.output_indices_[name]
+        width = out.stop - out.start
+        if width == 0:
+            continue
+
+        if isinstance(cols, str):
+            cols = [cols]
+        cols = list(cols)
+        if len(cols) and not isinstance(cols[0], str):
+            cols = list(np.asarray(preprocessor.feature_names_in_)[cols])
+
+        if width == len(cols):
+            sizes = [1] * len(cols)
+        elif isinstance(trans, OneHotEncoder):
+            dropped = trans.drop_idx_ if trans.drop_idx_ is not None else [None] * len(cols)
+            sizes = [
+                len(cats) - (drop is not None)
+                for cats, drop in zip(trans.categories_, dropped)
+            ]
+        else:
+            raise ValueError(
+                f"Cannot map outputs of transformer '{name}' back to its input columns"
+            )
+
+        if sum(sizes) != width:
+            raise ValueError(
+                f"Transformer '{name}' produced {width} features, expected {sum(sizes)}"
+            )
+
+        start = len(columns)
+        columns.extend(cols)
+        owners[out] = np.repeat(np.arange(start, start + len(cols)), sizes)
+
+    return columns, owners
+
+
+def _forest_path_matrix(forest: RandomForestClassifier) -> sparse.csr_matrix:
+    """Stack per-node contribution rows for every tree in the forest.
+
+    Row ``n`` holds the change in churn probability produced by entering node
+    ``n``, placed in the column of the feature its parent split on. Multiplying
+    the forest's decision-path indicator by this matrix sums the contributions
+    along each sample's path in every tree at once.
+    """
+    blocks = []
+    for est in forest.estimators_:
+        tree = est.tree_
+        values = tree.value[:, 0, :]
+        values = values[:, 1] / values.sum(axis=1)
+
+        parent = np.full(tree.node_count, -1)
+        internal = tree.children_left != -1
+        parent[tree.children_left[internal]] = np.flatnonzero(internal)
+        parent[tree.children_right[internal]] = np.flatnonzero(internal)
+
+        rows = np.flatnonzero(parent >= 0)
+        blocks.append(sparse.csr_matrix(
+            (
+                values[rows] - values[parent[rows]],
+                (rows, tree.feature[parent[rows]]),
+            ),
+            shape=(tree.node_count, forest.n_features_in_),
+        ))
+    return sparse.vstack(blocks, format="csr") / len(forest.estimators_)
+
+
+class PipelineExplainer:
+    """Vectorized per-feature contributions for a fitted churn pipeline.
+
+    Supports the classifiers produced by ``train.py``:
+
+    - LogisticRegression: exact coefficient x value contributions (log-odds).
+    - RandomForestClassifier: tree-path contributions (churn probability).
+    - XGBClassifier: tree-path contributions from the booster (log-odds).
+
+    Contributions are computed on the transformed feature matrix and then
+    summed back onto the original input columns of the ColumnTransformer.
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.preprocessor = pipeline.named_steps["preprocessor"]
+        self.classifier = pipeline.named_steps["classifier"]
+
+        self.columns, owners = _output_columns(self.preprocessor)
+        self._grouping = sparse.csr_matrix(
+            (np.ones(len(owners)), (np.arange(len(owners)), owners)),
+            shape=(len(owners), len(self.columns)),
+        )
+
+        if isinstance(self.classifier, LogisticRegression):
+            self.kind = "linear"
+            self.units = "log_odds"
+            self.base_value = float(self.classifier.intercept_[0])
+        elif isinstance(self.classifier, RandomForestClassifier):
+            self.kind = "forest"
+            self.units = "probability"
+            self._path_matrix = _forest_path_matrix(self.classifier)
+            self.base_value = float(np.mean([
+                est.tree_.value[0, 0, 1] / est.tree_.value[0, 0, :].sum()
+                for est in self.classifier.estimators_
+            ]))
+        elif type(self.classifier).__name__ == "XGBClassifier":
+            self.kind = "xgboost"
+            self.units = "log_odds"
+            # The bias column of pred_contribs is the same for every row.
+            self.base_value = float(self._booster_contribs(
+                np.zeros((1, len(owners)))
+            )[0, -1])
+        else:
+            raise ValueError(
+                f"Explanations are not supported for {type(self.classifier).__name__}"
+            )
+
+    def _booster_contribs(self, Xt):
+        import xgboost as xgb
+
+        return self.classifier.get_booster().predict(
+            xgb.DMatrix(Xt), pred_contribs=True, approx_contribs=True
+        )
+
+    def _feature_contributions(self, Xt):
+        if self.kind == "linear":
+            coef = self.classifier.coef_[0]
+            if sparse.issparse(Xt):
+                return sparse.csr_matrix(Xt).multiply(coef).toarray()
+            return np.asarray(Xt) * coef
+
+        if self.kind == "forest":
+            indicator, _ = self.classifier.decision_path(Xt)
+            return (indicator @ self._path_matrix).toarray()
+
+        return self._booster_contribs(Xt)[:, :-1]
+
+    def explain(self, X: pd.DataFrame) -> np.ndarray:
+        """Return an (n_rows, n_columns) array of contributions per input column."""
+        return self.explain_transformed(self.preprocessor.transform(X))
+
+    def explain_transformed(self, Xt) -> np.ndarray:
+        """Like ``explain`` but for a matrix already run through the preprocessor.
+
+        Lets callers reuse one transform for both contributions and
+        ``classifier.predict_proba``.
+        """
+        contribs = self._feature_contributions(Xt)
+        return np.asarray(contribs @ self._grouping)
+
+    def top_k(self, contributions: np.ndarray, k: int = None):
+        """Return per-row lists of (column, contribution), largest magnitude first."""
+        order = np.argsort(-np.abs(contributions), axis=1)
+        if k is not None:
+            order = order[:, :k]
+        names = np.asarray(self.columns, dtype=object)
+        values = np.take_along_axis(contributions, order, axis=1)
+        return [
+            [
+                {"feature": f, "contribution": float(v)}
+                for f, v in zip(names[idx], vals)
+            ]
+            for idx, vals in zip(order, values)
+        ]
+
+
+def benchmark(batch_sizes=(1, 10, 100, 1000), repeats=5):
+    """Time explanations of the saved model on processed test data, per row."""
+    root = get_root()
+    model = joblib.load(os.path.join(root, "src", "model", "model.pkl"))
+    test_df = pd.read_csv(os.path.join(root, "data", "processed", "test.csv"))
+    X = test_df.drop(columns=["Churn"])
+
+    explainer = PipelineExplainer(model)
+    print(f"Model: {type(explainer.classifier).__name__}, units={explainer.units}")
+
+    results = {}
+    for size in batch_sizes:
+        batch = X.sample(n=size, replace=size > len(X), random_state=42)
+        explainer.explain(batch)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            explainer.explain(batch)
+        elapsed = (time.perf_counter() - start) / repeats
+
+        results[size] = elapsed / size
+        print(f"batch={size:>5}  total={elapsed * 1e3:8.2f} ms  per_row={elapsed / size * 1e6:9.1f} us")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
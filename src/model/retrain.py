@@ -0,0 +1,241 @@
+import argparse
+import copy
+import os
+import sys
+
+import joblib
+import mlflow
+import mlflow.sklearn
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from scipy.special import expit
+
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import OneHotEncoder
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from data.preprocess import clean
+from model.train import encode_target, get_root
+from profiling import PROFILE_MODES, StageProfiler
+
+
+def check_vocabulary(preprocessor, X):
+    """Raise if ``X`` holds categories the fitted OneHotEncoder has never seen.
+
+    The warm-started classifier keeps the transformed feature layout of the
+    current model, so any new category would be silently dropped by
+    ``handle_unknown="ignore"`` instead of getting its own column.
+    """
+    missing = [c for c in preprocessor.feature_names_in_ if c not in X.columns]
+    if missing:
+        raise ValueError(f"New rows are missing columns: {missing}")
+
+    unseen = {}
+    for _, trans, cols in preprocessor.transformers_:
+        if not isinstance(trans, OneHotEncoder):
+            continue
+        for col, categories in zip(cols, trans.categories_):
+            new = set(X[col].unique()) - set(categories)
+            if new:
+                unseen[col] = sorted(map(str, new))
+
+    if unseen:
+        raise ValueError(
+            f"Category vocabulary would change, retrain from scratch instead: {unseen}"
+        )
+
+
+def penalized_logistic_update(clf, Xt, y, prior_strength):
+    """Refit a binary LogisticRegression on ``Xt``, ``y`` with an L2 pull toward its current weights.
+
+    Minimizes the log-loss summed over the new rows plus
+    ``prior_strength / 2 * ||w - w_current||^2`` (intercept included). A
+    plain ``warm_start`` refit would converge to the same optimum as a cold
+    fit on the new rows and discard the current model. ``prior_strength``
+    plays the role of a sample count: with ``prior_strength == len(y)`` the
+    current coefficients weigh roughly as much as the new batch.
+
+    The solver runs for at most ``clf.max_iter`` iterations and raises
+    RuntimeError if it does not converge, so partial weights never reach the
+    holdout comparison.
+    """
+    if list(clf.classes_) != [0, 1]:
+        raise ValueError("Incremental logistic regression updates require 0/1 targets")
+
+    y = np.asarray(y, dtype=float)
+    current = np.r_[clf.coef_[0], clf.intercept_]
+
+    def objective(params):
+        z = Xt @ params[:-1] + params[-1]
+        residual = expit(z) - y
+        diff = params - current
+        loss = np.sum(np.logaddexp(0, z) - y * z) + 0.5 * prior_strength * diff @ diff
+        grad = np.r_[Xt.T @ residual, residual.sum()] + prior_strength * diff
+        return loss, grad
+
+    result = minimize(
+        objective, current, jac=True, method="L-BFGS-B",
+        options={"maxiter": clf.max_iter},
+    )
+    if not result.success:
+        raise RuntimeError(
+            f"Logistic regression update did not converge after {result.nit} iterations: {result.message}"
+        )
+
+    clf.coef_ = result.x[:-1].reshape(1, -1)
+    clf.intercept_ = result.x[-1:]
+    clf.n_iter_ = np.array([result.nit], dtype=np.int32)
+    return clf
+
+
+def warm_start_update(pipeline, X, y, extra_estimators=20, prior_strength=None):
+    """Return a copy of ``pipeline`` whose classifier is updated on ``X``, ``y`` only.
+
+    The fitted preprocessor is reused unchanged. XGBoost continues boosting
+    from the current booster and the random forest grows ``extra_estimators``
+    new trees. Logistic regression is refit with an L2 penalty toward its
+    current coefficients (see ``penalized_logistic_update``). ``prior_strength``
+    defaults to the number of update rows.
+    """
+    updated = copy.deepcopy(pipeline)
+    preprocessor = updated.named_steps["preprocessor"]
+    clf = updated.named_steps["classifier"]
+    Xt = preprocessor.transform(X)
+
+    if isinstance(clf, LogisticRegression):
+        if prior_strength is None:
+            prior_strength = len(y)
+        penalized_logistic_update(clf, Xt, y, prior_strength)
+    elif isinstance(clf, RandomForestClassifier):
+        clf.set_params(
+            warm_start=True, n_estimators=len(clf.estimators_) + extra_estimators
+        )
+        clf.fit(Xt, y)
+    elif type(clf).__name__ == "XGBClassifier":
+        booster = clf.get_booster()
+        clf.set_params(n_estimators=extra_estimators)
+        clf.fit(Xt, y, xgb_model=booster)
+        clf.set_params(n_estimators=clf.get_booster().num_boosted_rounds())
+    else:
+        raise ValueError(
+            f"Incremental updates are not supported for {type(clf).__name__}"
+        )
+
+    return updated
+
+
+def retrain(new_data_path, holdout_size=0.2, extra_estimators=20, prior_strength=None, profile=None):
+    """Update the current model.pkl on newly labeled rows and promote it if it is better.
+
+    A stratified slice of the new rows is held out; the updated model is
+    promoted only when its accuracy on that slice beats the current model's.
+    Ties keep the current model.
+    """
+    root = get_root()
+    model_path = os.path.join(root, "src", "model", "model.pkl")
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(
+            f"Model file not found at {model_path}. Run src/model/train.py first to train and save the model."
+        )
+
+    profiler = StageProfiler("retrain", profile=profile)
+
+    with profiler.stage("load_data"):
+        current = joblib.load(model_path)
+        new_df = clean(pd.read_csv(new_data_path)).drop_duplicates()
+
+    target = "Churn"
+    if target not in new_df.columns:
+        raise ValueError("Churn column not found in new labeled data")
+
+    y = encode_target(new_df[target])
+    X = new_df.drop(columns=[target])
+    if y.nunique() < 2:
+        raise ValueError("New labeled rows must contain both churn outcomes")
+
+    check_vocabulary(current.named_steps["preprocessor"], X)
+
+    X_upd, X_hold, y_upd, y_hold = train_test_split(
+        X, y, test_size=holdout_size, random_state=42, stratify=y
+    )
+
+    mlflow.set_experiment("customer_churn_training")
+
+    classifier = current.named_steps["classifier"]
+    if isinstance(classifier, LogisticRegression) and prior_strength is None:
+        prior_strength = len(y_upd)
+
+    with mlflow.start_run(run_name="incremental_update"):
+        model_name = type(classifier).__name__
+        mlflow.log_param("model_name", model_name)
+        mlflow.log_param("new_rows", len(X))
+        mlflow.log_param("extra_estimators", extra_estimators)
+        if isinstance(classifier, LogisticRegression):
+            mlflow.log_param("prior_strength", prior_strength)
+
+        with profiler.stage("classifier_update"):
+            candidate = warm_start_update(
+                current, X_upd, y_upd, extra_estimators, prior_strength
+            )
+
+        with profiler.stage("score_holdout"):
+            current_acc = current.score(X_hold, y_hold)
+            candidate_acc = candidate.score(X_hold, y_hold)
+
+        promoted = candidate_acc > current_acc
+        mlflow.log_metric("current_holdout_accuracy", current_acc)
+        mlflow.log_metric("candidate_holdout_accuracy", candidate_acc)
+        mlflow.log_param("promoted", promoted)
+
+        if promoted:
+            with profiler.stage("log_model"):
+                mlflow.sklearn.log_model(candidate, "model")
+            with profiler.stage("save_model"):
+                joblib.dump(candidate, model_path)
+
+        profiler.log_to_mlflow()
+        profiler.write_report()
+
+    print(
+        f"{model_name}: holdout accuracy current={current_acc:.4f}, "
+        f"candidate={candidate_acc:.4f}"
+    )
+    if promoted:
+        print(f"Promoted updated model to {model_path}")
+    else:
+        print("Kept current model; updated model was not better on the holdout slice")
+    return promoted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Warm-start the current model on newly labeled rows."
+    )
+    parser.add_argument("new_data", help="CSV of newly labeled rows, including 'Churn'.")
+    parser.add_argument("--holdout-size", type=float, default=0.2)
+    parser.add_argument(
+        "--extra-estimators", type=int, default=20,
+        help="Trees (random_forest) or boosting rounds (xgboost) to add.",
+    )
+    parser.add_argument(
+        "--prior-strength", type=float, default=None,
+        help="L2 pull toward the current log_reg coefficients (default: number of update rows).",
+    )
+    parser.add_argument(
+        "--profile", choices=PROFILE_MODES, default=None,
+        help="Write a cProfile or sampling-profiler output for every stage.",
+    )
+    args = parser.parse_args()
+    retrain(
+        args.new_data,
+        holdout_size=args.holdout_size,
+        extra_estimators=args.extra_estimators,
+        prior_strength=args.prior_strength,
+        profile=args.profile,
+    )
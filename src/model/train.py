@@ -1,4 +1,6 @@
+import argparse
 import os
+import sys
 import numpy as np
 import pandas as pd
 import joblib
@@ -14,6 +16,12 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from xgboost import XGBClassifier
 
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from profiling import PROFILE_MODES, StageProfiler
+
 def get_root():
     return os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 
@@ -29,8 +37,11 @@ def encode_target(series):
     s = series.astype(str).str.strip().str.lower()
     return s.isin(["yes", "1", "true"]).astype(int)
 
-def train():
-    train_df, test_df = load_data()
+def train(profile=None):
+    profiler = StageProfiler("train", profile=profile)
+
+    with profiler.stage("load_data"):
+        train_df, test_df = load_data()
 
     target = "Churn"
     if target not in train_df.columns:
@@ -78,36 +89,59 @@ def train():
 
     mlflow.set_experiment("customer_churn_training")
 
-    for name, model in models.items():
-        pipe = Pipeline(steps=[
-            ("preprocessor", preprocessor),
-            ("classifier", model),
-        ])
-
-        with mlflow.start_run(run_name=name):
-            pipe.fit(X_tr, y_tr)
-            val_acc = pipe.score(X_val, y_val)
-            test_acc = pipe.score(X_test, y_test)
-
-            mlflow.log_param("model_name", name)
-            mlflow.log_metric("val_accuracy", val_acc)
-            mlflow.log_metric("test_accuracy", test_acc)
-            mlflow.sklearn.log_model(pipe, "model")
-
-        if val_acc > best_score:
-            best_score = val_acc
-            best_name = name
-            best_pipeline = pipe
-
-    root = get_root()
-    model_dir = os.path.join(root, "src", "model")
-    os.makedirs(model_dir, exist_ok=True)
-
-    model_path = os.path.join(model_dir, "model.pkl")
-    joblib.dump(best_pipeline, model_path)
+    with mlflow.start_run(run_name="train_pipeline"):
+        mlflow.log_param("profile", profile)
+
+        for name, model in models.items():
+            pipe = Pipeline(steps=[
+                ("preprocessor", preprocessor),
+                ("classifier", model),
+            ])
+
+            with mlflow.start_run(run_name=name, nested=True):
+                # Equivalent to pipe.fit, split so both halves are timed separately
+                with profiler.stage(f"{name}/preprocessor_fit"):
+                    Xt_tr = pipe.named_steps["preprocessor"].fit_transform(X_tr)
+                with profiler.stage(f"{name}/classifier_fit"):
+                    pipe.named_steps["classifier"].fit(Xt_tr, y_tr)
+                with profiler.stage(f"{name}/score_val"):
+                    val_acc = pipe.score(X_val, y_val)
+                with profiler.stage(f"{name}/score_test"):
+                    test_acc = pipe.score(X_test, y_test)
+
+                mlflow.log_param("model_name", name)
+                mlflow.log_metric("val_accuracy", val_acc)
+                mlflow.log_metric("test_accuracy", test_acc)
+                with profiler.stage(f"{name}/log_model"):
+                    mlflow.sklearn.log_model(pipe, "model")
+                profiler.log_to_mlflow(prefix=f"{name}/")
+
+            if val_acc > best_score:
+                best_score = val_acc
+                best_name = name
+                best_pipeline = pipe
+
+        root = get_root()
+        model_dir = os.path.join(root, "src", "model")
+        os.makedirs(model_dir, exist_ok=True)
+
+        model_path = os.path.join(model_dir, "model.pkl")
+        with profiler.stage("save_model"):
+            joblib.dump(best_pipeline, model_path)
+
+        mlflow.log_param("best_model", best_name)
+        profiler.log_to_mlflow()
+        report_path = profiler.write_report()
 
     print(f"Best model: {best_name}, val_accuracy={best_score:.4f}")
     print(f"Saved model to {model_path}")
+    print(f"Stage timings written to {report_path}")
 
 if __name__ == "__main__":
-    train()
+    parser = argparse.ArgumentParser(description="Train and select the churn model.")
+    parser.add_argument(
+        "--profile", choices=PROFILE_MODES, default=None,
+        help="Write a cProfile or sampling-profiler output for every stage.",
+    )
+    args = parser.parse_args()
+    train(profile=args.profile)
@@ -0,0 +1,203 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+import mlflow
+import psutil
+
+
+PROFILE_MODES = ("cprofile", "sampling")
+
+
+class RssSampler:
+    """Track the highest resident set size of this process over an interval.
+
+    A background thread polls RSS every ``interval`` seconds; ``start`` and
+    ``stop`` also take a sample so very short stages are still covered.
+    Works on every platform psutil supports and sees native allocations.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = None
+        self.start_rss = 0
+        self.peak_rss = 0
+
+    def _sample(self):
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self.start_rss = self.peak_rss = self._process.memory_info().rss
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._sample()
+        self._stop.set()
+        self._thread.join()
+
+
+class SamplingProfiler:
+    """Periodically sample the stack of one thread into folded-stack counts.
+
+    The output uses the "collapsed" format understood by flamegraph.pl and
+    speedscope: one ``frame;frame;frame count`` line per distinct stack.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = Counter()
+        self._target = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path: str):
+        with open(path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class StageProfiler:
+    """Record wall-clock time and peak memory for named pipeline stages.
+
+    Usage:
+        profiler = StageProfiler("train", profile="cprofile")
+        with profiler.stage("load_data"):
+            ...
+        profiler.log_to_mlflow()
+        profiler.write_report()
+
+    Memory is the process RSS sampled by a background thread while each stage
+    runs, so it includes native allocations (numpy, xgboost).
+
+    - profile: None, "cprofile" (one .prof file per stage) or "sampling"
+      (one folded-stack .folded file per stage).
+    """
+
+    def __init__(self, name: str, profile: str = None, output_dir: str = None):
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"profile must be one of {PROFILE_MODES}, got '{profile}'")
+
+        self.name = name
+        self.profile = profile
+        if output_dir is None:
+            root = os.path.dirname(os.path.dirname(__file__))
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_dir = os.path.join(root, "reports", "profiling", f"{name}_{ts}")
+        self.output_dir = output_dir
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, stage_name: str):
+        """Time the enclosed block and track its peak memory under ``stage_name``.
+
+        ``peak_rss_mb`` is the highest RSS seen while the stage ran and
+        ``peak_rss_increase_mb`` is that peak minus the RSS when it started.
+        Stages should not be nested.
+        """
+        rss = RssSampler()
+        rss.start()
+
+        profiler = None
+        if self.profile == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        elif self.profile == "sampling":
+            profiler = SamplingProfiler()
+            profiler.start()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            rss.stop()
+
+            if profiler is not None:
+                if self.profile == "cprofile":
+                    profiler.disable()
+                else:
+                    profiler.stop()
+                self._dump_profile(stage_name, profiler)
+
+            self.stages[stage_name] = {
+                "seconds": elapsed,
+                "peak_rss_mb": rss.peak_rss / 1024 ** 2,
+                "peak_rss_increase_mb": (rss.peak_rss - rss.start_rss) / 1024 ** 2,
+            }
+
+    def _dump_profile(self, stage_name, profiler):
+        os.makedirs(self.output_dir, exist_ok=True)
+        filename = stage_name.replace("/", "__")
+        if self.profile == "cprofile":
+            profiler.dump_stats(os.path.join(self.output_dir, f"{filename}.prof"))
+        else:
+            profiler.dump(os.path.join(self.output_dir, f"{filename}.folded"))
+
+    def metrics(self, prefix: str = "") -> dict:
+        """Flatten recorded stages starting with ``prefix`` into MLflow metric names."""
+        out = {}
+        for stage_name, values in self.stages.items():
+            if not stage_name.startswith(prefix):
+                continue
+            key = stage_name[len(prefix):]
+            out[f"{key}_seconds"] = values["seconds"]
+            out[f"{key}_peak_rss_mb"] = values["peak_rss_mb"]
+            out[f"{key}_peak_rss_increase_mb"] = values["peak_rss_increase_mb"]
+        return out
+
+    def log_to_mlflow(self, prefix: str = ""):
+        """Log stage metrics to the active MLflow run."""
+        mlflow.log_metrics(self.metrics(prefix))
+
+    def write_report(self) -> str:
+        """Write the JSON timing report, attach it to the active MLflow run and return its path."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        report = {
+            "name": self.name,
+            "profile": self.profile,
+            "total_seconds": sum(s["seconds"] for s in self.stages.values()),
+            "stages": self.stages,
+        }
+        report_path = os.path.join(self.output_dir, "timings.json")
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+        if mlflow.active_run() is not None:
+            mlflow.log_artifacts(self.output_dir, artifact_path="profiling")
+
+        return report_path
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+
+def _make_data(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        "tenure": rng.integers(0, 72, n),
+        "MonthlyCharges": rng.uniform(20, 120, n).round(2),
+        "Contract": rng.choice(["Month-to-month", "One year", "Two year"], n),
+        "PaymentMethod": rng.choice(["Electronic check", "Mailed check"], n),
+    })
+    y = ((X["Contract"] == "Month-to-month") & (X["tenure"] < 24)).astype(int)
+    return X, y
+
+
+def _make_pipeline(classifier):
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("num", StandardScaler(), ["tenure", "MonthlyCharges"]),
+            ("cat", OneHotEncoder(handle_unknown="ignore"), ["Contract", "PaymentMethod"]),
+        ]
+    )
+    return Pipeline(steps=[
+        ("preprocessor", preprocessor),
+        ("classifier", classifier),
+    ])
+
+
+@pytest.fixture
+def make_data():
+    """Factory for a small synthetic churn frame: ``make_data(n=300, seed=0) -> (X, y)``."""
+    return _make_data
+
+
+@pytest.fixture
+def make_pipeline():
+    """Factory for a churn-style preprocessor + ``classifier`` Pipeline."""
+    return _make_pipeline
@@ -147,3 +147,37 @@ def test_predict_model_missing_returns_500(monkeypatch, client):
     assert resp.status_code == 500
     body = resp.get_json()
     assert "error" in body
+
+
+def test_explain_returns_top_k_contributions(monkeypatch, client, make_data, make_pipeline):
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = make_data()
+    pipe = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    monkeypatch.setattr(app_module, "load_model", lambda: pipe)
+
+    payload = {"data": X.head(3).to_dict(orient="records"), "top_k": 2}
+    resp = client.post(
+        "/explain",
+        data=json.dumps(payload),
+        content_type="application/json",
+    )
+    assert resp.status_code == 200, resp.get_data(as_text=True)
+    body = resp.get_json()
+    assert body["units"] == "log_odds"
+    assert len(body["contributions"]) == 3
+    assert all(len(row) == 2 for row in body["contributions"])
+    assert len(body["churn_probability"]) == 3
+
+
+def test_explain_bad_top_k(monkeypatch, client):
+    monkeypatch.setattr(app_module, "load_model", lambda: DummyModel())
+
+    resp = client.post(
+        "/explain",
+        data=json.dumps({"data": [{"a": 1}], "top_k": 0}),
+        content_type="application/json",
+    )
+    assert resp.status_code == 400
+    body = resp.get_json()
+    assert "error" in body
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from xgboost import XGBClassifier
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from model.explain import PipelineExplainer
+
+
+@pytest.mark.parametrize("classifier", [
+    LogisticRegression(max_iter=200),
+    RandomForestClassifier(n_estimators=10, random_state=42),
+    XGBClassifier(n_estimators=10, max_depth=3, random_state=42),
+])
+def test_contributions_add_up_to_prediction(classifier, make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(classifier).fit(X, y)
+
+    explainer = PipelineExplainer(pipe)
+    contributions = explainer.explain(X)
+
+    assert explainer.columns == ["tenure", "MonthlyCharges", "Contract", "PaymentMethod"]
+    assert contributions.shape == (len(X), 4)
+
+    proba = pipe.predict_proba(X)[:, 1]
+    if explainer.units == "probability":
+        expected = proba
+    else:
+        expected = np.log(proba / (1 - proba))
+    np.testing.assert_allclose(contributions.sum(axis=1) + explainer.base_value, expected, atol=1e-4)
+
+
+def test_top_k_orders_by_magnitude(make_data, make_pipeline):
+    X, y = make_data()
+    explainer = PipelineExplainer(make_pipeline(LogisticRegression(max_iter=200)).fit(X, y))
+
+    rows = explainer.top_k(explainer.explain(X.head(5)), k=2)
+
+    assert len(rows) == 5
+    for row in rows:
+        assert len(row) == 2
+        assert abs(row[0]["contribution"]) >= abs(row[1]["contribution"])
+
+
+def test_unsupported_classifier_raises(make_data, make_pipeline):
+    from sklearn.neighbors import KNeighborsClassifier
+
+    X, y = make_data()
+    pipe = make_pipeline(KNeighborsClassifier()).fit(X, y)
+
+    with pytest.raises(ValueError):
+        PipelineExplainer(pipe)
+
+
+def test_explain_transformed_matches_explain(make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    explainer = PipelineExplainer(pipe)
+
+    Xt = explainer.preprocessor.transform(X)
+
+    np.testing.assert_allclose(explainer.explain_transformed(Xt), explainer.explain(X))
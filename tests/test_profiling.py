@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from profiling import StageProfiler
+
+
+def test_stage_records_time_and_memory(tmp_path):
+    profiler = StageProfiler("unit", output_dir=str(tmp_path))
+
+    with profiler.stage("allocate"):
+        buf = b"x" * (64 * 1024 ** 2)
+    del buf
+
+    stage = profiler.stages["allocate"]
+    assert stage["seconds"] >= 0
+    assert stage["peak_rss_increase_mb"] >= 48
+
+    report_path = profiler.write_report()
+    with open(report_path) as f:
+        report = json.load(f)
+    assert report["name"] == "unit"
+    assert "allocate" in report["stages"]
+
+
+def test_later_stage_reports_its_own_peak(tmp_path):
+    profiler = StageProfiler("unit", output_dir=str(tmp_path))
+
+    with profiler.stage("small"):
+        buf = b"x" * (64 * 1024 ** 2)
+        del buf
+    with profiler.stage("idle"):
+        time.sleep(0.05)
+    with profiler.stage("large"):
+        # Freed before the stage ends, so only the background sampler sees it
+        buf = b"x" * (256 * 1024 ** 2)
+        time.sleep(0.1)
+        del buf
+
+    assert profiler.stages["idle"]["peak_rss_increase_mb"] < 32
+    assert profiler.stages["large"]["peak_rss_increase_mb"] >= 192
+    assert profiler.stages["large"]["peak_rss_mb"] > profiler.stages["idle"]["peak_rss_mb"]
+
+
+def test_metrics_prefix_filters_and_strips(tmp_path):
+    profiler = StageProfiler("unit", output_dir=str(tmp_path))
+    with profiler.stage("log_reg/fit"):
+        pass
+    with profiler.stage("save_model"):
+        pass
+
+    assert set(profiler.metrics(prefix="log_reg/")) == {
+        "fit_seconds", "fit_peak_rss_mb", "fit_peak_rss_increase_mb",
+    }
+    assert "log_reg/fit_seconds" in profiler.metrics()
+
+
+@pytest.mark.parametrize("mode, ext", [("cprofile", ".prof"), ("sampling", ".folded")])
+def test_profile_modes_write_one_file_per_stage(tmp_path, mode, ext):
+    profiler = StageProfiler("unit", profile=mode, output_dir=str(tmp_path))
+
+    with profiler.stage("model/work"):
+        sum(i * i for i in range(200000))
+
+    assert os.path.exists(tmp_path / f"model__work{ext}")
+
+
+def test_unknown_profile_mode_raises():
+    with pytest.raises(ValueError):
+        StageProfiler("unit", profile="perf")
@@ -0,0 +1,170 @@
+import sys
+from pathlib import Path
+
+import joblib
+import mlflow
+import numpy as np
+import pytest
+
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from xgboost import XGBClassifier
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import model.retrain as retrain_module
+from model.retrain import check_vocabulary, retrain, warm_start_update
+from profiling import StageProfiler
+
+
+@pytest.fixture
+def retrain_root(tmp_path, monkeypatch):
+    """Point retrain() at a temporary project root, MLflow store and report dir."""
+    (tmp_path / "src" / "model").mkdir(parents=True)
+    monkeypatch.setattr(retrain_module, "get_root", lambda: str(tmp_path))
+    monkeypatch.setattr(
+        retrain_module, "StageProfiler",
+        lambda name, profile=None: StageProfiler(
+            name, profile=profile, output_dir=str(tmp_path / "reports")
+        ),
+    )
+    monkeypatch.setattr(mlflow.sklearn, "log_model", lambda *args, **kwargs: None)
+
+    previous_uri = mlflow.get_tracking_uri()
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+    yield tmp_path
+    mlflow.set_tracking_uri(previous_uri)
+
+
+def write_labeled_csv(path, X, y):
+    X.assign(Churn=np.where(y == 1, "Yes", "No")).to_csv(path, index=False)
+    return str(path)
+
+
+def test_random_forest_update_adds_trees(make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(RandomForestClassifier(n_estimators=10, random_state=42)).fit(X, y)
+    X_new, y_new = make_data(n=100, seed=1)
+
+    updated = warm_start_update(pipe, X_new, y_new, extra_estimators=5)
+
+    assert len(updated.named_steps["classifier"].estimators_) == 15
+    assert len(pipe.named_steps["classifier"].estimators_) == 10
+    assert updated.predict(X_new).shape == (100,)
+
+
+def test_xgboost_update_continues_boosting(make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(XGBClassifier(n_estimators=10, max_depth=3, random_state=42)).fit(X, y)
+    X_new, y_new = make_data(n=100, seed=1)
+
+    updated = warm_start_update(pipe, X_new, y_new, extra_estimators=5)
+
+    assert updated.named_steps["classifier"].get_booster().num_boosted_rounds() == 15
+    assert pipe.named_steps["classifier"].get_booster().num_boosted_rounds() == 10
+
+
+def test_logistic_regression_update_keeps_prior(make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    current = pipe.named_steps["classifier"].coef_.copy()
+
+    # New batch follows a different rule, so a cold fit moves far from the current weights
+    X_new, _ = make_data(n=100, seed=1)
+    y_new = (X_new["tenure"] < 12).astype(int)
+    Xt_new = pipe.named_steps["preprocessor"].transform(X_new)
+    cold = LogisticRegression(max_iter=200).fit(Xt_new, y_new).coef_
+
+    updated = warm_start_update(pipe, X_new, y_new).named_steps["classifier"].coef_
+
+    assert not np.allclose(updated, cold, atol=1e-2)
+    assert np.linalg.norm(updated - current) < np.linalg.norm(cold - current)
+    np.testing.assert_array_equal(pipe.named_steps["classifier"].coef_, current)
+
+    pinned = warm_start_update(pipe, X_new, y_new, prior_strength=1e6)
+    np.testing.assert_allclose(pinned.named_steps["classifier"].coef_, current, atol=1e-2)
+
+
+def test_logistic_regression_update_records_iterations_and_refuses_non_convergence(make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    X_new, _ = make_data(n=100, seed=1)
+    y_new = (X_new["tenure"] < 12).astype(int)
+
+    updated = warm_start_update(pipe, X_new, y_new).named_steps["classifier"]
+    assert 0 < updated.n_iter_[0] <= 200
+
+    pipe.named_steps["classifier"].set_params(max_iter=1)
+    with pytest.raises(RuntimeError, match="did not converge"):
+        warm_start_update(pipe, X_new, y_new)
+
+
+def test_unseen_category_is_refused(make_data, make_pipeline):
+    X, y = make_data()
+    pipe = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    X_new, _ = make_data(n=20, seed=1)
+    X_new.loc[0, "Contract"] = "Three year"
+
+    with pytest.raises(ValueError, match="vocabulary"):
+        check_vocabulary(pipe.named_steps["preprocessor"], X_new)
+
+    check_vocabulary(pipe.named_steps["preprocessor"], make_data(n=20, seed=2)[0])
+
+
+def test_retrain_promotes_better_model(retrain_root, make_data, make_pipeline):
+    X, y = make_data()
+    # Current model learned inverted labels, so the update should clearly beat it
+    current = make_pipeline(RandomForestClassifier(n_estimators=5, random_state=42)).fit(X, 1 - y)
+    model_path = retrain_root / "src" / "model" / "model.pkl"
+    joblib.dump(current, model_path)
+    X_new, y_new = make_data(n=400, seed=1)
+
+    promoted = retrain(
+        write_labeled_csv(retrain_root / "new.csv", X_new, y_new), extra_estimators=50
+    )
+
+    assert promoted
+    assert len(joblib.load(model_path).named_steps["classifier"].estimators_) == 55
+    run = mlflow.search_runs(experiment_names=["customer_churn_training"]).iloc[0]
+    assert "params.prior_strength" not in run.index
+
+
+def test_retrain_keeps_current_model_on_tie(retrain_root, monkeypatch, make_data, make_pipeline):
+    X, y = make_data()
+    current = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    model_path = retrain_root / "src" / "model" / "model.pkl"
+    joblib.dump(current, model_path)
+    before = model_path.read_bytes()
+    monkeypatch.setattr(
+        retrain_module, "warm_start_update", lambda pipeline, *args: pipeline
+    )
+    X_new, y_new = make_data(n=200, seed=1)
+
+    promoted = retrain(write_labeled_csv(retrain_root / "new.csv", X_new, y_new))
+
+    assert not promoted
+    assert model_path.read_bytes() == before
+    # The default prior strength is resolved to the number of update rows before logging
+    run = mlflow.search_runs(experiment_names=["customer_churn_training"]).iloc[0]
+    assert run["params.prior_strength"] == "160"
+
+
+def test_retrain_refuses_vocabulary_change_before_writing(retrain_root, make_data, make_pipeline):
+    X, y = make_data()
+    current = make_pipeline(LogisticRegression(max_iter=200)).fit(X, y)
+    model_path = retrain_root / "src" / "model" / "model.pkl"
+    joblib.dump(current, model_path)
+    before = model_path.read_bytes()
+    X_new, y_new = make_data(n=200, seed=1)
+    X_new.loc[0, "Contract"] = "Three year"
+
+    with pytest.raises(ValueError, match="vocabulary"):
+        retrain(write_labeled_csv(retrain_root / "new.csv", X_new, y_new))
+
+    assert model_path.read_bytes() == before
+    assert not (retrain_root / "mlruns").exists()
+    assert not (retrain_root / "reports").exists()